@@ -7,219 +7,292 @@ Allows AI assistants to browse subreddits, read posts, get comments, and search
 """
 
 import asyncio
+import functools
+import io
 import os
-from typing import Any, Sequence
-from dotenv import load_dotenv
-import praw
-from praw.exceptions import RedditAPIException, PRAWException
+import random
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal, Optional, Sequence
+from pydantic import BaseModel, Field
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
-import mcp.server.stdio
 
-# Load environment variables
-load_dotenv()
+# asyncpraw, aiohttp and dotenv are imported on first use so the server can
+# answer initialize/tools/list without paying for them at startup
+if TYPE_CHECKING:
+    import aiohttp
+    import asyncpraw
 
-# Initialize Reddit client
-reddit = praw.Reddit(
-    client_id=os.getenv("REDDIT_CLIENT_ID"),
-    client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-    user_agent=os.getenv("REDDIT_USER_AGENT", "RedditMCPServer/1.0.0"),
-    check_for_async=False
-)
+# Concurrency and retry settings
+MAX_CONCURRENT_CALLS = 1024
+MAX_CONNECTIONS = 256
+MAX_CONNECTIONS_PER_HOST = 64
+DNS_CACHE_TTL = 600
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+MAX_CACHED_MODELS = 2048
+
+@functools.cache
+def retryable_errors() -> tuple[type[Exception], ...]:
+    """Errors worth retrying with back-off: HTTP 429 responses.
+
+    asyncprawcore already retries 5xx responses itself and throttles every
+    request on Reddit's X-Ratelimit-* headers, so only 429s are left to us.
+    """
+    from asyncprawcore.exceptions import TooManyRequests
+    return (TooManyRequests,)
+
+call_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+
+def create_session() -> "aiohttp.ClientSession":
+    """Create the pooled HTTP session shared by all Reddit requests.
+
+    This is the only session the server opens; the Reddit client reuses it for
+    every request so TCP and TLS connections stay warm across tool calls.
+    """
+    import aiohttp
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS,
+        limit_per_host=MAX_CONNECTIONS_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    )
+
+def create_reddit(session: "aiohttp.ClientSession") -> "asyncpraw.Reddit":
+    """Create the Reddit client on top of the shared HTTP session."""
+    import asyncpraw
+    return asyncpraw.Reddit(
+        client_id=os.getenv("REDDIT_CLIENT_ID"),
+        client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+        user_agent=os.getenv("REDDIT_USER_AGENT", "RedditMCPServer/1.0.0"),
+        requestor_kwargs={"session": session}
+    )
+
+@functools.cache
+def get_reddit() -> "asyncpraw.Reddit":
+    """Return the Reddit client, creating it and its HTTP session on first use.
+
+    Must be called from inside the running event loop; main() closes it on exit.
+    """
+    return create_reddit(create_session())
+
+class ModelCache:
+    """LRU cache of lazy Reddit model objects keyed by case-insensitive name."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, name, factory):
+        """Return the cached object for ``name``, creating it with ``factory`` on a miss."""
+        key = name.lower()
+        async with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                item = await factory(name)
+                self._items[key] = item
+                if len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+            else:
+                self._items.move_to_end(key)
+            return item
+
+subreddit_cache = ModelCache(MAX_CACHED_MODELS)
+redditor_cache = ModelCache(MAX_CACHED_MODELS)
+
+async def get_subreddit(name: str):
+    """Return a lazy Subreddit, reusing the object from earlier calls for the same name."""
+    return await subreddit_cache.get(name, get_reddit().subreddit)
+
+async def get_redditor(name: str):
+    """Return a lazy Redditor, reusing the object from earlier calls for the same name."""
+    return await redditor_cache.get(name, get_reddit().redditor)
+
+async def call_with_retry(
+    handler: Callable[[BaseModel], Awaitable[list[types.TextContent]]],
+    arguments: BaseModel
+) -> list[types.TextContent]:
+    """Run a tool handler, retrying rate-limited (429) calls with exponential back-off."""
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return await handler(arguments)
+        except retryable_errors() as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, RETRY_BASE_DELAY)
+            if e.retry_after:
+                delay = max(delay, float(e.retry_after))
+            await asyncio.sleep(delay)
+
+TimeFilter = Literal["hour", "day", "week", "month", "year", "all"]
+
+class GetSubredditPostsArgs(BaseModel):
+    """Arguments for the get_subreddit_posts tool."""
+    subreddit: str = Field(description="Name of the subreddit (without r/)")
+    sort: Literal["hot", "new", "rising", "top"] = Field(
+        "hot", description="Sort method: hot, new, rising, top"
+    )
+    time_filter: TimeFilter = Field(
+        "day", description="Time filter for 'top' sort: hour, day, week, month, year, all"
+    )
+    limit: int = Field(25, ge=1, le=100, description="Number of posts to fetch (1-100)")
+
+class GetPostDetailsArgs(BaseModel):
+    """Arguments for the get_post_details tool."""
+    post_id: str = Field(description="Reddit post ID or full URL")
+    include_comments: bool = Field(False, description="Whether to include top-level comments")
+
+class GetPostCommentsArgs(BaseModel):
+    """Arguments for the get_post_comments tool."""
+    post_id: str = Field(description="Reddit post ID or full URL")
+    sort: Literal["best", "top", "new", "controversial"] = Field(
+        "best", description="Comment sort method: best, top, new, controversial"
+    )
+    limit: int = Field(50, ge=1, le=100, description="Number of comments to fetch (1-100)")
+
+class SearchRedditArgs(BaseModel):
+    """Arguments for the search_reddit tool."""
+    query: str = Field(description="Search query")
+    subreddit: Optional[str] = Field(None, description="Limit search to specific subreddit (optional)")
+    sort: Literal["relevance", "hot", "top", "new", "comments"] = Field(
+        "relevance", description="Sort method: relevance, hot, top, new, comments"
+    )
+    time_filter: TimeFilter = Field(
+        "all", description="Time filter: hour, day, week, month, year, all"
+    )
+    limit: int = Field(25, ge=1, le=100, description="Number of results to return (1-100)")
+
+class GetUserProfileArgs(BaseModel):
+    """Arguments for the get_user_profile tool."""
+    username: str = Field(description="Reddit username (without u/)")
+
+class GetSubredditInfoArgs(BaseModel):
+    """Arguments for the get_subreddit_info tool."""
+    subreddit: str = Field(description="Name of the subreddit (without r/)")
+
+# Tool name -> argument model, validated once before the handler runs
+_MODELS: dict[str, type[BaseModel]] = {
+    "get_subreddit_posts": GetSubredditPostsArgs,
+    "get_post_details": GetPostDetailsArgs,
+    "get_post_comments": GetPostCommentsArgs,
+    "search_reddit": SearchRedditArgs,
+    "get_user_profile": GetUserProfileArgs,
+    "get_subreddit_info": GetSubredditInfoArgs,
+}
+
+async def _collect(iterable) -> list:
+    """Drain an async iterator (e.g. a listing generator) into a list."""
+    return [item async for item in iterable]
 
 # Create MCP server instance
 server = Server("reddit-mcp-server")
 
+# Tool name -> description shown to clients
+_TOOL_DESCRIPTIONS: dict[str, str] = {
+    "get_subreddit_posts": "Get posts from a specific subreddit",
+    "get_post_details": "Get detailed information about a specific Reddit post",
+    "get_post_comments": "Get comments from a specific Reddit post",
+    "search_reddit": "Search Reddit for posts matching a query",
+    "get_user_profile": "Get public information about a Reddit user",
+    "get_subreddit_info": "Get information about a subreddit",
+}
+
+# Tool definitions are static, so build them once at import time; each input
+# schema comes from the argument model, so what is advertised is what is validated
+_TOOLS_CACHE: list[types.Tool] = [
+    types.Tool(
+        name=name,
+        description=_TOOL_DESCRIPTIONS[name],
+        inputSchema=model.model_json_schema()
+    )
+    for name, model in _MODELS.items()
+]
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available Reddit tools."""
-    return [
-        types.Tool(
-            name="get_subreddit_posts",
-            description="Get posts from a specific subreddit",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "subreddit": {
-                        "type": "string",
-                        "description": "Name of the subreddit (without r/)"
-                    },
-                    "sort": {
-                        "type": "string",
-                        "description": "Sort method: hot, new, rising, top",
-                        "enum": ["hot", "new", "rising", "top"],
-                        "default": "hot"
-                    },
-                    "time_filter": {
-                        "type": "string",
-                        "description": "Time filter for 'top' sort: hour, day, week, month, year, all",
-                        "enum": ["hour", "day", "week", "month", "year", "all"],
-                        "default": "day"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of posts to fetch (1-100)",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "default": 25
-                    }
-                },
-                "required": ["subreddit"]
-            }
-        ),
-        types.Tool(
-            name="get_post_details",
-            description="Get detailed information about a specific Reddit post",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "post_id": {
-                        "type": "string",
-                        "description": "Reddit post ID or full URL"
-                    },
-                    "include_comments": {
-                        "type": "boolean",
-                        "description": "Whether to include top-level comments",
-                        "default": False
-                    }
-                },
-                "required": ["post_id"]
-            }
-        ),
-        types.Tool(
-            name="get_post_comments",
-            description="Get comments from a specific Reddit post",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "post_id": {
-                        "type": "string",
-                        "description": "Reddit post ID or full URL"
-                    },
-                    "sort": {
-                        "type": "string",
-                        "description": "Comment sort method: best, top, new, controversial",
-                        "enum": ["best", "top", "new", "controversial"],
-                        "default": "best"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of comments to fetch (1-100)",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "default": 50
-                    }
-                },
-                "required": ["post_id"]
-            }
-        ),
-        types.Tool(
-            name="search_reddit",
-            description="Search Reddit for posts matching a query",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query"
-                    },
-                    "subreddit": {
-                        "type": "string",
-                        "description": "Limit search to specific subreddit (optional)"
-                    },
-                    "sort": {
-                        "type": "string",
-                        "description": "Sort method: relevance, hot, top, new, comments",
-                        "enum": ["relevance", "hot", "top", "new", "comments"],
-                        "default": "relevance"
-                    },
-                    "time_filter": {
-                        "type": "string",
-                        "description": "Time filter: hour, day, week, month, year, all",
-                        "enum": ["hour", "day", "week", "month", "year", "all"],
-                        "default": "all"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of results to return (1-100)",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "default": 25
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="get_user_profile",
-            description="Get public information about a Reddit user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "username": {
-                        "type": "string",
-                        "description": "Reddit username (without u/)"
-                    }
-                },
-                "required": ["username"]
-            }
-        ),
-        types.Tool(
-            name="get_subreddit_info",
-            description="Get information about a subreddit",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "subreddit": {
-                        "type": "string",
-                        "description": "Name of the subreddit (without r/)"
-                    }
-                },
-                "required": ["subreddit"]
-            }
-        )
-    ]
+    return list(_TOOLS_CACHE)
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
     """Handle tool execution requests."""
+    from asyncpraw.exceptions import AsyncPRAWException, RedditAPIException
     
     try:
-        if name == "get_subreddit_posts":
-            return await get_subreddit_posts(arguments)
-        elif name == "get_post_details":
-            return await get_post_details(arguments)
-        elif name == "get_post_comments":
-            return await get_post_comments(arguments)
-        elif name == "search_reddit":
-            return await search_reddit(arguments)
-        elif name == "get_user_profile":
-            return await get_user_profile(arguments)
-        elif name == "get_subreddit_info":
-            return await get_subreddit_info(arguments)
-        else:
+        handler = _HANDLERS.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        args = _MODELS[name].model_validate(arguments)
+        async with call_semaphore:
+            return await call_with_retry(handler, args)
             
     except RedditAPIException as e:
         error_msg = f"Reddit API Error: {e.message}"
         return [types.TextContent(type="text", text=error_msg)]
-    except RedditException as e:
+    except AsyncPRAWException as e:
         error_msg = f"Reddit Error: {str(e)}"
         return [types.TextContent(type="text", text=error_msg)]
     except Exception as e:
         error_msg = f"Error: {str(e)}"
         return [types.TextContent(type="text", text=error_msg)]
 
-async def get_subreddit_posts(args: dict[str, Any]) -> list[types.TextContent]:
+def _fmt_ts(ts: float) -> str:
+    """Format a Reddit ``created_utc`` epoch as an ISO-8601 UTC timestamp."""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(timespec="seconds")
+
+def _write_post(w: Callable[[str], Any], i: int, post) -> None:
+    """Write one post of a subreddit listing as Markdown."""
+    author = post.author.name if post.author else "[deleted]"
+    st = post.selftext
+    selftext = f"{st[:500]}..." if len(st) > 500 else st
+    ratio_pct = int(post.upvote_ratio * 100)
+    flair = post.link_flair_text
+    w(f"### {i}. {post.title}\n")
+    w(f"- **Author:** u/{author}\n")
+    w(f"- **Score:** {post.score} ({ratio_pct}% upvoted)\n")
+    w(f"- **Comments:** {post.num_comments}\n")
+    w(f"- **Created:** {_fmt_ts(post.created_utc)}\n")
+    w(f"- **URL:** {post.url}\n")
+    w(f"- **Reddit Link:** https://reddit.com{post.permalink}\n")
+    if flair:
+        w(f"- **Flair:** {flair}\n")
+    if selftext:
+        w(f"- **Text:** {selftext}\n")
+    w(f"- **NSFW:** {'Yes' if post.over_18 else 'No'}\n")
+    w(f"- **Post ID:** {post.id}\n\n")
+
+def _write_search_result(w: Callable[[str], Any], i: int, post) -> None:
+    """Write one search hit as Markdown."""
+    author = post.author.name if post.author else "[deleted]"
+    st = post.selftext
+    selftext = f"{st[:200]}..." if len(st) > 200 else st
+    w(f"### {i}. {post.title}\n")
+    w(f"- **Subreddit:** r/{post.subreddit.display_name}\n")
+    w(f"- **Author:** u/{author}\n")
+    w(f"- **Score:** {post.score} | **Comments:** {post.num_comments}\n")
+    w(f"- **URL:** {post.url}\n")
+    w(f"- **Reddit Link:** https://reddit.com{post.permalink}\n")
+    if selftext:
+        w(f"- **Preview:** {selftext}\n")
+    w(f"- **Post ID:** {post.id}\n\n")
+
+async def get_subreddit_posts(args: GetSubredditPostsArgs) -> list[types.TextContent]:
     """Get posts from a subreddit."""
-    subreddit_name = args["subreddit"]
-    sort_method = args.get("sort", "hot")
-    time_filter = args.get("time_filter", "day")
-    limit = args.get("limit", 25)
+    subreddit_name = args.subreddit
+    sort_method = args.sort
+    time_filter = args.time_filter
+    limit = args.limit
     
     try:
-        subreddit = reddit.subreddit(subreddit_name)
+        subreddit = await get_subreddit(subreddit_name)
         
         # Get posts based on sort method
         if sort_method == "hot":
@@ -233,110 +306,97 @@ async def get_subreddit_posts(args: dict[str, Any]) -> list[types.TextContent]:
         else:
             posts = subreddit.hot(limit=limit)
         
-        results = []
-        for post in posts:
-            post_info = {
-                "title": post.title,
-                "author": str(post.author) if post.author else "[deleted]",
-                "score": post.score,
-                "upvote_ratio": post.upvote_ratio,
-                "num_comments": post.num_comments,
-                "created_utc": post.created_utc,
-                "url": post.url,
-                "permalink": f"https://reddit.com{post.permalink}",
-                "id": post.id,
-                "selftext": post.selftext[:500] + "..." if len(post.selftext) > 500 else post.selftext,
-                "subreddit": str(post.subreddit),
-                "flair": post.link_flair_text,
-                "is_self": post.is_self,
-                "over_18": post.over_18
-            }
-            results.append(post_info)
-        
-        # Format results
-        output = f"## Posts from r/{subreddit_name} (sorted by {sort_method})\n\n"
-        for i, post in enumerate(results, 1):
-            output += f"### {i}. {post['title']}\n"
-            output += f"- **Author:** u/{post['author']}\n"
-            output += f"- **Score:** {post['score']} ({int(post['upvote_ratio']*100)}% upvoted)\n"
-            output += f"- **Comments:** {post['num_comments']}\n"
-            output += f"- **URL:** {post['url']}\n"
-            output += f"- **Reddit Link:** {post['permalink']}\n"
-            if post['flair']:
-                output += f"- **Flair:** {post['flair']}\n"
-            if post['selftext']:
-                output += f"- **Text:** {post['selftext']}\n"
-            output += f"- **NSFW:** {'Yes' if post['over_18'] else 'No'}\n"
-            output += f"- **Post ID:** {post['id']}\n\n"
+        # Format each post as it arrives
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## Posts from r/{subreddit_name} (sorted by {sort_method})\n\n")
+        i = 0
+        async for post in posts:
+            i += 1
+            _write_post(w, i, post)
         
-        return [types.TextContent(type="text", text=output)]
+        return [types.TextContent(type="text", text=buf.getvalue())]
         
+    except retryable_errors():
+        raise
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error fetching posts from r/{subreddit_name}: {str(e)}")]
 
-async def get_post_details(args: dict[str, Any]) -> list[types.TextContent]:
+async def get_post_details(args: GetPostDetailsArgs) -> list[types.TextContent]:
     """Get detailed information about a specific post."""
-    post_id = args["post_id"]
-    include_comments = args.get("include_comments", False)
+    post_id = args.post_id
+    include_comments = args.include_comments
     
     try:
         # Handle both post ID and full URL
         if "reddit.com" in post_id:
-            submission = reddit.submission(url=post_id)
+            submission = await get_reddit().submission(url=post_id, fetch=False)
         else:
-            submission = reddit.submission(id=post_id)
+            submission = await get_reddit().submission(id=post_id, fetch=False)
+        
+        # Show the highest-scored comments; Reddit's comment limit counts replies too,
+        # so it is left at the default to keep ten top-level comments available
+        submission.comment_sort = "top"
+        await submission.load()
         
         # Get post details
-        output = f"## {submission.title}\n\n"
-        output += f"**Author:** u/{submission.author if submission.author else '[deleted]'}\n"
-        output += f"**Subreddit:** r/{submission.subreddit}\n"
-        output += f"**Score:** {submission.score} ({int(submission.upvote_ratio*100)}% upvoted)\n"
-        output += f"**Comments:** {submission.num_comments}\n"
-        output += f"**Created:** {submission.created_utc}\n"
-        output += f"**URL:** {submission.url}\n"
-        output += f"**Permalink:** https://reddit.com{submission.permalink}\n"
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## {submission.title}\n\n")
+        w(f"**Author:** u/{submission.author.name if submission.author else '[deleted]'}\n")
+        w(f"**Subreddit:** r/{submission.subreddit.display_name}\n")
+        w(f"**Score:** {submission.score} ({int(submission.upvote_ratio*100)}% upvoted)\n")
+        w(f"**Comments:** {submission.num_comments}\n")
+        w(f"**Created:** {_fmt_ts(submission.created_utc)}\n")
+        w(f"**URL:** {submission.url}\n")
+        w(f"**Permalink:** https://reddit.com{submission.permalink}\n")
         if submission.link_flair_text:
-            output += f"**Flair:** {submission.link_flair_text}\n"
-        output += f"**NSFW:** {'Yes' if submission.over_18 else 'No'}\n\n"
+            w(f"**Flair:** {submission.link_flair_text}\n")
+        w(f"**NSFW:** {'Yes' if submission.over_18 else 'No'}\n\n")
         
         if submission.selftext:
-            output += f"### Post Content\n{submission.selftext}\n\n"
+            w(f"### Post Content\n{submission.selftext}\n\n")
         
         if include_comments:
-            output += "### Top Comments\n\n"
-            submission.comments.replace_more(limit=0)
-            for i, comment in enumerate(submission.comments[:10], 1):
-                if hasattr(comment, 'body'):
-                    output += f"**{i}.** u/{comment.author if comment.author else '[deleted]'} "
-                    output += f"(Score: {comment.score})\n"
-                    comment_body = comment.body[:300] + "..." if len(comment.body) > 300 else comment.body
-                    output += f"{comment_body}\n\n"
+            w("### Top Comments\n\n")
+            top_comments = [comment for comment in submission.comments if hasattr(comment, 'body')][:10]
+            for i, comment in enumerate(top_comments, 1):
+                w(f"**{i}.** u/{comment.author.name if comment.author else '[deleted]'} ")
+                w(f"(Score: {comment.score})\n")
+                comment_body = comment.body[:300] + "..." if len(comment.body) > 300 else comment.body
+                w(f"{comment_body}\n\n")
         
-        return [types.TextContent(type="text", text=output)]
+        return [types.TextContent(type="text", text=buf.getvalue())]
         
+    except retryable_errors():
+        raise
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error fetching post details: {str(e)}")]
 
-async def get_post_comments(args: dict[str, Any]) -> list[types.TextContent]:
+async def get_post_comments(args: GetPostCommentsArgs) -> list[types.TextContent]:
     """Get comments from a specific post."""
-    post_id = args["post_id"]
-    sort_method = args.get("sort", "best")
-    limit = args.get("limit", 50)
+    post_id = args.post_id
+    sort_method = args.sort
+    limit = args.limit
     
     try:
         # Handle both post ID and full URL
         if "reddit.com" in post_id:
-            submission = reddit.submission(url=post_id)
+            submission = await get_reddit().submission(url=post_id, fetch=False)
         else:
-            submission = reddit.submission(id=post_id)
+            submission = await get_reddit().submission(id=post_id, fetch=False)
         
+        # Comment sort must be set before the submission is fetched
         submission.comment_sort = sort_method
-        submission.comments.replace_more(limit=0)
+        await submission.load()
+        await submission.comments.replace_more(limit=0)
         
-        output = f"## Comments for: {submission.title}\n\n"
-        output += f"**Post by:** u/{submission.author if submission.author else '[deleted]'} in r/{submission.subreddit}\n"
-        output += f"**Total Comments:** {submission.num_comments}\n"
-        output += f"**Sorted by:** {sort_method}\n\n"
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## Comments for: {submission.title}\n\n")
+        w(f"**Post by:** u/{submission.author.name if submission.author else '[deleted]'} in r/{submission.subreddit.display_name}\n")
+        w(f"**Total Comments:** {submission.num_comments}\n")
+        w(f"**Sorted by:** {sort_method}\n\n")
         
         comment_count = 0
         for comment in submission.comments:
@@ -344,162 +404,189 @@ async def get_post_comments(args: dict[str, Any]) -> list[types.TextContent]:
                 break
             if hasattr(comment, 'body') and comment.body != '[deleted]':
                 comment_count += 1
-                output += f"### Comment {comment_count}\n"
-                output += f"**Author:** u/{comment.author if comment.author else '[deleted]'}\n"
-                output += f"**Score:** {comment.score}\n"
-                output += f"**Content:** {comment.body}\n\n"
+                w(f"### Comment {comment_count}\n")
+                w(f"**Author:** u/{comment.author.name if comment.author else '[deleted]'}\n")
+                w(f"**Score:** {comment.score}\n")
+                w(f"**Content:** {comment.body}\n\n")
                 
-        return [types.TextContent(type="text", text=output)]
+        return [types.TextContent(type="text", text=buf.getvalue())]
         
+    except retryable_errors():
+        raise
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error fetching comments: {str(e)}")]
 
-async def search_reddit(args: dict[str, Any]) -> list[types.TextContent]:
+async def search_reddit(args: SearchRedditArgs) -> list[types.TextContent]:
     """Search Reddit for posts matching a query."""
-    query = args["query"]
-    subreddit_name = args.get("subreddit")
-    sort_method = args.get("sort", "relevance")
-    time_filter = args.get("time_filter", "all")
-    limit = args.get("limit", 25)
+    query = args.query
+    subreddit_name = args.subreddit
+    sort_method = args.sort
+    time_filter = args.time_filter
+    limit = args.limit
     
     try:
         if subreddit_name:
-            subreddit = reddit.subreddit(subreddit_name)
+            subreddit = await get_subreddit(subreddit_name)
             search_results = subreddit.search(query, sort=sort_method, time_filter=time_filter, limit=limit)
             search_scope = f"r/{subreddit_name}"
         else:
-            search_results = reddit.subreddit("all").search(query, sort=sort_method, time_filter=time_filter, limit=limit)
+            all_subreddit = await get_subreddit("all")
+            search_results = all_subreddit.search(query, sort=sort_method, time_filter=time_filter, limit=limit)
             search_scope = "All of Reddit"
         
-        output = f"## Search Results for '{query}' in {search_scope}\n\n"
-        output += f"**Sort:** {sort_method} | **Time Filter:** {time_filter} | **Limit:** {limit}\n\n"
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## Search Results for '{query}' in {search_scope}\n\n")
+        w(f"**Sort:** {sort_method} | **Time Filter:** {time_filter} | **Limit:** {limit}\n\n")
         
-        results = []
-        for post in search_results:
-            results.append({
-                "title": post.title,
-                "author": str(post.author) if post.author else "[deleted]",
-                "subreddit": str(post.subreddit),
-                "score": post.score,
-                "num_comments": post.num_comments,
-                "url": post.url,
-                "permalink": f"https://reddit.com{post.permalink}",
-                "id": post.id,
-                "selftext": post.selftext[:200] + "..." if len(post.selftext) > 200 else post.selftext
-            })
+        i = 0
+        async for post in search_results:
+            i += 1
+            _write_search_result(w, i, post)
         
-        if not results:
+        if i == 0:
             return [types.TextContent(type="text", text=f"No results found for '{query}'")]
         
-        for i, post in enumerate(results, 1):
-            output += f"### {i}. {post['title']}\n"
-            output += f"- **Subreddit:** r/{post['subreddit']}\n"
-            output += f"- **Author:** u/{post['author']}\n"
-            output += f"- **Score:** {post['score']} | **Comments:** {post['num_comments']}\n"
-            output += f"- **URL:** {post['url']}\n"
-            output += f"- **Reddit Link:** {post['permalink']}\n"
-            if post['selftext']:
-                output += f"- **Preview:** {post['selftext']}\n"
-            output += f"- **Post ID:** {post['id']}\n\n"
-        
-        return [types.TextContent(type="text", text=output)]
+        return [types.TextContent(type="text", text=buf.getvalue())]
         
+    except retryable_errors():
+        raise
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error searching Reddit: {str(e)}")]
 
-async def get_user_profile(args: dict[str, Any]) -> list[types.TextContent]:
+async def get_user_profile(args: GetUserProfileArgs) -> list[types.TextContent]:
     """Get public information about a Reddit user."""
-    username = args["username"]
+    username = args.username
     
     try:
-        user = reddit.redditor(username)
+        user = await get_redditor(username)
+        
+        # Fetch the profile and recent posts concurrently
+        loaded, recent_posts = await asyncio.gather(
+            user.load(),
+            _collect(user.submissions.new(limit=10)),
+            return_exceptions=True
+        )
+        if isinstance(loaded, Exception):
+            raise loaded
         
-        output = f"## User Profile: u/{username}\n\n"
-        output += f"**Comment Karma:** {user.comment_karma}\n"
-        output += f"**Link Karma:** {user.link_karma}\n"
-        output += f"**Account Created:** {user.created_utc}\n"
-        output += f"**Has Verified Email:** {'Yes' if user.has_verified_email else 'No'}\n"
-        output += f"**Is Employee:** {'Yes' if user.is_employee else 'No'}\n"
-        output += f"**Is Gold:** {'Yes' if user.is_gold else 'No'}\n"
-        output += f"**Is Mod:** {'Yes' if user.is_mod else 'No'}\n"
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## User Profile: u/{username}\n\n")
+        w(f"**Comment Karma:** {user.comment_karma}\n")
+        w(f"**Link Karma:** {user.link_karma}\n")
+        w(f"**Account Created:** {_fmt_ts(user.created_utc)}\n")
+        w(f"**Has Verified Email:** {'Yes' if user.has_verified_email else 'No'}\n")
+        w(f"**Is Employee:** {'Yes' if user.is_employee else 'No'}\n")
+        w(f"**Is Gold:** {'Yes' if user.is_gold else 'No'}\n")
+        w(f"**Is Mod:** {'Yes' if user.is_mod else 'No'}\n")
         
-        if hasattr(user, 'subreddit') and user.subreddit:
-            output += f"**Profile Description:** {user.subreddit.public_description}\n"
+        sub = getattr(user, 'subreddit', None)
+        if sub:
+            w(f"**Profile Description:** {sub.public_description}\n")
         
         # Get recent posts
-        output += "\n### Recent Posts (Last 10)\n\n"
-        try:
-            for i, post in enumerate(user.submissions.new(limit=10), 1):
-                output += f"{i}. **{post.title}** in r/{post.subreddit} "
-                output += f"(Score: {post.score}, Comments: {post.num_comments})\n"
-        except Exception:
-            output += "Recent posts not available\n"
+        w("\n### Recent Posts (Last 10)\n\n")
+        if isinstance(recent_posts, Exception):
+            w("Recent posts not available\n")
+        else:
+            for i, post in enumerate(recent_posts, 1):
+                w(f"{i}. **{post.title}** in r/{post.subreddit.display_name} ")
+                w(f"(Score: {post.score}, Comments: {post.num_comments})\n")
         
-        return [types.TextContent(type="text", text=output)]
+        return [types.TextContent(type="text", text=buf.getvalue())]
         
+    except retryable_errors():
+        raise
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error fetching user profile: {str(e)}")]
 
-async def get_subreddit_info(args: dict[str, Any]) -> list[types.TextContent]:
+async def get_subreddit_info(args: GetSubredditInfoArgs) -> list[types.TextContent]:
     """Get information about a subreddit."""
-    subreddit_name = args["subreddit"]
+    subreddit_name = args.subreddit
     
     try:
-        subreddit = reddit.subreddit(subreddit_name)
+        subreddit = await get_subreddit(subreddit_name)
         
-        output = f"## r/{subreddit_name}\n\n"
-        output += f"**Display Name:** {subreddit.display_name}\n"
-        output += f"**Title:** {subreddit.title}\n"
-        output += f"**Subscribers:** {subreddit.subscribers:,}\n"
-        output += f"**Active Users:** {subreddit.active_user_count}\n"
-        output += f"**Created:** {subreddit.created_utc}\n"
-        output += f"**NSFW:** {'Yes' if subreddit.over18 else 'No'}\n"
-        output += f"**Type:** {subreddit.subreddit_type}\n"
+        # Metadata, rules and moderators are independent requests, so fetch them concurrently
+        loaded, rules, mods = await asyncio.gather(
+            subreddit.load(),
+            _collect(subreddit.rules),
+            subreddit.moderator(),
+            return_exceptions=True
+        )
+        if isinstance(loaded, Exception):
+            raise loaded
+        
+        buf = io.StringIO()
+        w = buf.write
+        w(f"## r/{subreddit_name}\n\n")
+        w(f"**Display Name:** {subreddit.display_name}\n")
+        w(f"**Title:** {subreddit.title}\n")
+        w(f"**Subscribers:** {subreddit.subscribers:,}\n")
+        w(f"**Active Users:** {subreddit.active_user_count}\n")
+        w(f"**Created:** {_fmt_ts(subreddit.created_utc)}\n")
+        w(f"**NSFW:** {'Yes' if subreddit.over18 else 'No'}\n")
+        w(f"**Type:** {subreddit.subreddit_type}\n")
         
         if subreddit.public_description:
-            output += f"\n**Description:**\n{subreddit.public_description}\n"
+            w(f"\n**Description:**\n{subreddit.public_description}\n")
         
         # Rules
-        try:
-            rules = subreddit.rules()
-            if rules:
-                output += f"\n### Rules\n\n"
-                for i, rule in enumerate(rules, 1):
-                    output += f"{i}. **{rule.short_name}**: {rule.description[:200]}...\n"
-        except:
-            pass
+        if rules and not isinstance(rules, Exception):
+            w(f"\n### Rules\n\n")
+            for i, rule in enumerate(rules, 1):
+                w(f"{i}. **{rule.short_name}**: {rule.description[:200]}...\n")
             
         # Moderators
-        try:
-            mods = list(subreddit.moderator(limit=10))
-            if mods:
-                output += f"\n### Moderators\n"
-                mod_names = [str(mod) for mod in mods if str(mod) != 'None']
-                output += ", ".join(mod_names) + "\n"
-        except:
-            pass
+        if mods and not isinstance(mods, Exception):
+            w(f"\n### Moderators\n")
+            mod_names = [mod.name for mod in mods[:10] if mod.name != 'None']
+            w(", ".join(mod_names) + "\n")
         
-        return [types.TextContent(type="text", text=output)]
+        return [types.TextContent(type="text", text=buf.getvalue())]
         
+    except retryable_errors():
+        raise
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error fetching subreddit info: {str(e)}")]
 
+# Tool name -> handler coroutine
+_HANDLERS: dict[str, Callable[[Any], Awaitable[list[types.TextContent]]]] = {
+    "get_subreddit_posts": get_subreddit_posts,
+    "get_post_details": get_post_details,
+    "get_post_comments": get_post_comments,
+    "search_reddit": search_reddit,
+    "get_user_profile": get_user_profile,
+    "get_subreddit_info": get_subreddit_info,
+}
+
 async def main():
     """Run the Reddit MCP server."""
-    # Run the server using stdin/stdout streams
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="reddit-mcp-server",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={}
+    from dotenv import load_dotenv
+    import mcp.server.stdio
+
+    # Load environment variables
+    load_dotenv()
+
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="reddit-mcp-server",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    finally:
+        # Close the shared HTTP session if a tool call ever opened it
+        if get_reddit.cache_info().currsize:
+            await get_reddit().close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -7,217 +7,342 @@ to ensure it's working correctly before deployment.
 """
 
 import asyncio
+import contextvars
+import io
+import itertools
+import json
 import os
 import sys
-from dotenv import load_dotenv
-import praw
+import time
 
-# Load environment variables
+# Load environment variables; values already set in the shell take precedence
+from dotenv import load_dotenv
 load_dotenv()
 
-def check_reddit_credentials():
-    """Test Reddit API credentials."""
+# Read once; every client in the suite is built from these settings
+CREDS = {
+    "client_id": os.getenv("REDDIT_CLIENT_ID"),
+    "client_secret": os.getenv("REDDIT_CLIENT_SECRET"),
+    "user_agent": os.getenv("REDDIT_USER_AGENT", "RedditMCPServer/1.0.0"),
+}
+
+# Few enough tests in flight to stay well under Reddit's request-per-minute quota
+MAX_CONCURRENT_TESTS = 5
+
+# Pool sized to the concurrent tests, with headroom for listing pagination
+MAX_CONNECTIONS = 20
+REQUEST_TIMEOUT = 30
+
+# How long a fetched "top hot post" stays reusable across tests
+HOT_CACHE_TTL = 300
+
+_hot_cache = {}
+
+# Subreddits whose top hot post the tests read; prefetched together in one listing
+TEST_SUBREDDITS = ["python", "technology", "AskReddit", "news"]
+
+# Profile data changes slowly, so keep it on disk between runs
+PROFILE_CACHE_FILE = ".reddit_test_cache.json"
+PROFILE_CACHE_TTL = 300
+
+def read_profile_cache(key):
+    """Return the cached entry for ``key`` if it is younger than PROFILE_CACHE_TTL, else None."""
+    try:
+        with open(PROFILE_CACHE_FILE) as f:
+            entry = json.load(f).get(key)
+    except (OSError, ValueError):
+        return None
+    if entry and time.time() - entry["stored_at"] < PROFILE_CACHE_TTL:
+        return entry["data"]
+    return None
+
+def write_profile_cache(key, data):
+    """Store ``data`` under ``key``; a cache that cannot be written is simply skipped."""
+    try:
+        with open(PROFILE_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cache[key] = {"stored_at": time.time(), "data": data}
+    try:
+        with open(PROFILE_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+# Latest quota Reddit reported; asyncpraw's auth.limits does not expose the reset time
+_rate_limit = {"remaining": None, "reset_at": None}
+
+async def _record_rate_limit(session, context, params):
+    """Remember the X-Ratelimit-* headers of every response."""
+    headers = params.response.headers
+    if "x-ratelimit-remaining" in headers:
+        _rate_limit["remaining"] = float(headers["x-ratelimit-remaining"])
+        _rate_limit["reset_at"] = time.time() + float(headers.get("x-ratelimit-reset", 0))
+
+def create_reddit():
+    """Create the Reddit client shared by all tests.
+
+    The client owns one pooled HTTP session, so every test reuses the same
+    keep-alive connections; closing the client closes the session too.
+    """
+    # Imported here so a missing-credentials run never pays for the HTTP stack
+    import aiohttp
+    import asyncpraw
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_end.append(_record_rate_limit)
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=MAX_CONNECTIONS),
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+        trace_configs=[trace_config]
+    )
+    return asyncpraw.Reddit(**CREDS, requestor_kwargs={"session": session})
+
+# Output buffer of the test running in the current task, if any
+_output = contextvars.ContextVar("output", default=None)
+
+def log(message=""):
+    """Print a line, or hold it in the running test's buffer.
+
+    Concurrent tests each write to their own buffer, and main() prints them in
+    order once all have finished, so their lines never interleave.
+    """
+    buf = _output.get()
+    if buf is None:
+        print(message)
+    else:
+        buf.write(message + "\n")
+
+async def first(listing):
+    """Return the first item of a listing (or None) without draining the rest."""
+    async for item in listing:
+        return item
+    return None
+
+async def hot_one(reddit, sub_name):
+    """Return the top hot post of a subreddit (or None), cached for HOT_CACHE_TTL seconds."""
+    key = sub_name.lower()
+    entry = _hot_cache.get(key)
+    if entry and time.monotonic() - entry[0] < HOT_CACHE_TTL:
+        return entry[1]
+    subreddit = await reddit.subreddit(sub_name)
+    post = await first(subreddit.hot(limit=1))
+    _hot_cache[key] = (time.monotonic(), post)
+    return post
+
+async def prefetch(reddit):
+    """Fill the hot-post cache for every test subreddit from one combined listing.
+
+    A full page (100 posts) of r/a+b+c makes it very likely each subreddit
+    appears; one that does not is left uncached so hot_one fetches it directly.
+    """
+    combined = await reddit.subreddit("+".join(TEST_SUBREDDITS))
+    first_posts = {}
+    async for post in combined.hot(limit=100):
+        first_posts.setdefault(post.subreddit.display_name.lower(), post)
+    now = time.monotonic()
+    for key, post in first_posts.items():
+        _hot_cache[key] = (now, post)
+
+async def check_reddit_credentials():
+    """Test Reddit API credentials.
+
+    Returns the Reddit client on success so the remaining tests can reuse it,
+    or None if the credentials are missing or rejected.
+    """
     print("🔍 Testing Reddit API credentials...")
     
-    required_vars = ['REDDIT_CLIENT_ID', 'REDDIT_CLIENT_SECRET', 'REDDIT_USER_AGENT']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = [f"REDDIT_{key.upper()}" for key, value in CREDS.items() if not value]
     
     if missing_vars:
         print(f"❌ Missing environment variables: {', '.join(missing_vars)}")
         print("Please check your .env file")
-        return False
+        return None
     
+    reddit = create_reddit()
     try:
-        reddit = praw.Reddit(
-            client_id=os.getenv("REDDIT_CLIENT_ID"),
-            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-            user_agent=os.getenv("REDDIT_USER_AGENT"),
-            check_for_async=False
-        )
-        
-        # Test API access
-        subreddit = reddit.subreddit("python")
-        post = next(subreddit.hot(limit=1))
+        # Test API access; the same request prefetches what the other tests read
+        await prefetch(reddit)
+        post = await hot_one(reddit, "python")
         print(f"✅ Reddit API connection successful")
-        print(f"   Test post: {post.title[:50]}...")
-        return True
+        if post is not None:
+            print(f"   Test post: {post.title[:50]}...")
+        else:
+            print("   r/python returned no hot posts")
+        return reddit
         
     except Exception as e:
         print(f"❌ Reddit API connection failed: {e}")
-        return False
+        await reddit.close()
+        return None
 
-def test_subreddit_access():
+async def check_subreddit_access(reddit):
     """Test accessing various subreddits."""
-    print("\n🔍 Testing subreddit access...")
+    log("\n🔍 Testing subreddit access...")
     
     try:
-        reddit = praw.Reddit(
-            client_id=os.getenv("REDDIT_CLIENT_ID"),
-            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-            user_agent=os.getenv("REDDIT_USER_AGENT"),
-            check_for_async=False
-        )
-        
-        # Test popular subreddits
-        test_subreddits = ["python", "technology", "AskReddit", "news"]
-        
-        for sub_name in test_subreddits:
-            try:
-                subreddit = reddit.subreddit(sub_name)
-                posts = list(subreddit.hot(limit=1))
-                if posts:
-                    print(f"✅ r/{sub_name}: {posts[0].title[:40]}...")
-                else:
-                    print(f"⚠️  r/{sub_name}: No posts found")
-            except Exception as e:
-                print(f"❌ r/{sub_name}: {e}")
+        # Test popular subreddits, served from the prefetched listing
+        for sub_name in TEST_SUBREDDITS:
+            post = await hot_one(reddit, sub_name)
+            if post:
+                log(f"✅ r/{sub_name}: {post.title[:40]}...")
+            else:
+                log(f"⚠️  r/{sub_name}: No posts found")
         
         return True
         
     except Exception as e:
-        print(f"❌ Subreddit access test failed: {e}")
+        log(f"❌ Subreddit access test failed: {e}")
         return False
 
-def test_search_functionality():
+async def check_search_functionality(reddit):
     """Test Reddit search functionality."""
-    print("\n🔍 Testing search functionality...")
+    log("\n🔍 Testing search functionality...")
     
     try:
-        reddit = praw.Reddit(
-            client_id=os.getenv("REDDIT_CLIENT_ID"),
-            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-            user_agent=os.getenv("REDDIT_USER_AGENT"),
-            check_for_async=False
-        )
-        
         # Test search
-        search_results = list(reddit.subreddit("python").search("tutorial", limit=3))
+        subreddit = await reddit.subreddit("python")
+        search_results = [post async for post in subreddit.search("tutorial", limit=3)]
         
         if search_results:
-            print(f"✅ Search working: Found {len(search_results)} results")
+            log(f"✅ Search working: Found {len(search_results)} results")
             for i, post in enumerate(search_results, 1):
-                print(f"   {i}. {post.title[:40]}...")
+                log(f"   {i}. {post.title[:40]}...")
         else:
-            print("⚠️  Search returned no results")
+            log("⚠️  Search returned no results")
         
         return True
         
     except Exception as e:
-        print(f"❌ Search test failed: {e}")
+        log(f"❌ Search test failed: {e}")
         return False
 
-def test_user_access():
+async def check_user_access(reddit):
     """Test user profile access."""
-    print("\n🔍 Testing user profile access...")
+    log("\n🔍 Testing user profile access...")
     
     try:
-        reddit = praw.Reddit(
-            client_id=os.getenv("REDDIT_CLIENT_ID"),
-            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-            user_agent=os.getenv("REDDIT_USER_AGENT"),
-            check_for_async=False
-        )
-        
         # Test with Reddit admin account
-        user = reddit.redditor("spez")
-        print(f"✅ User access working")
-        print(f"   Profile: u/{user.name}")
-        print(f"   Comment Karma: {user.comment_karma}")
-        print(f"   Link Karma: {user.link_karma}")
+        key = "user:spez"
+        data = read_profile_cache(key)
+        if data is None:
+            # fetch=True loads every profile field in one request
+            user = await reddit.redditor("spez", fetch=True)
+            data = {"name": user.name, "comment_karma": user.comment_karma, "link_karma": user.link_karma}
+            write_profile_cache(key, data)
+        log(f"✅ User access working")
+        log(f"   Profile: u/{data['name']}")
+        log(f"   Comment Karma: {data['comment_karma']}")
+        log(f"   Link Karma: {data['link_karma']}")
         
         return True
         
     except Exception as e:
-        print(f"❌ User access test failed: {e}")
+        log(f"❌ User access test failed: {e}")
         return False
 
-def test_comment_access():
+async def check_comment_access(reddit):
     """Test comment retrieval."""
-    print("\n🔍 Testing comment access...")
+    log("\n🔍 Testing comment access...")
     
     try:
-        reddit = praw.Reddit(
-            client_id=os.getenv("REDDIT_CLIENT_ID"),
-            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-            user_agent=os.getenv("REDDIT_USER_AGENT"),
-            check_for_async=False
-        )
-        
         # Get a post with comments
-        subreddit = reddit.subreddit("AskReddit")
-        post = next(subreddit.hot(limit=1))
+        post = await hot_one(reddit, "AskReddit")
         
-        if post.num_comments > 0:
-            post.comments.replace_more(limit=0)
-            comments = list(post.comments[:3])
-            print(f"✅ Comment access working")
-            print(f"   Post: {post.title[:40]}...")
-            print(f"   Comments found: {len(comments)}")
+        if post is not None and post.num_comments > 0:
+            # Listing entries carry no comments; loading the post fetches a
+            # small top-level page of them, so no MoreComments expansion is needed
+            from asyncpraw.models import MoreComments
+            post.comment_limit = 3
+            await post.load()
+            comments = list(itertools.islice(
+                (c for c in post.comments if not isinstance(c, MoreComments)), 3
+            ))
+            if len(comments) < 3:
+                await post.comments.replace_more(limit=1)
+                comments = post.comments[:3]
+            log(f"✅ Comment access working")
+            log(f"   Post: {post.title[:40]}...")
+            log(f"   Comments found: {len(comments)}")
         else:
-            print("⚠️  Test post has no comments")
+            log("⚠️  Test post has no comments")
         
         return True
         
     except Exception as e:
-        print(f"❌ Comment access test failed: {e}")
+        log(f"❌ Comment access test failed: {e}")
         return False
 
-def test_rate_limiting():
+async def check_rate_limiting(reddit):
     """Test rate limiting behavior."""
-    print("\n🔍 Testing rate limiting behavior...")
+    log("\n🔍 Testing rate limiting behavior...")
     
     try:
-        reddit = praw.Reddit(
-            client_id=os.getenv("REDDIT_CLIENT_ID"),
-            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-            user_agent=os.getenv("REDDIT_USER_AGENT"),
-            check_for_async=False
-        )
+        # Wait out an exhausted quota instead of provoking a 429
+        remaining = _rate_limit["remaining"]
+        if remaining is not None and remaining < 1:
+            wait = max(0, _rate_limit["reset_at"] - time.time())
+            log(f"   Rate limit exhausted, waiting {wait:.0f}s for reset")
+            await asyncio.sleep(wait)
         
-        # Make several requests quickly
-        subreddit = reddit.subreddit("python")
-        requests_made = 0
+        # One listing request for several posts, then read the quota Reddit reported
+        subreddit = await reddit.subreddit("python")
+        posts = [post async for post in subreddit.hot(limit=5)]
+        limits = reddit.auth.limits
+        reset_in = max(0, (_rate_limit["reset_at"] or time.time()) - time.time())
         
-        for i in range(5):
-            try:
-                posts = list(subreddit.hot(limit=1))
-                requests_made += 1
-            except Exception as e:
-                print(f"   Request {i+1} failed: {e}")
-                break
-        
-        print(f"✅ Made {requests_made} requests successfully")
-        print("   Rate limiting appears to be handled correctly")
+        log(f"✅ Fetched {len(posts)} posts in a single request")
+        log(f"   Rate limit remaining: {limits.get('remaining')}, used: {limits.get('used')}, resets in: {reset_in:.0f}s")
         
         return True
         
     except Exception as e:
-        print(f"❌ Rate limiting test failed: {e}")
+        log(f"❌ Rate limiting test failed: {e}")
         return False
 
-def main():
+async def run_test(semaphore, test_func, reddit, buf):
+    """Run one test while holding a slot of the concurrency limit, logging into ``buf``."""
+    _output.set(buf)
+    async with semaphore:
+        return await test_func(reddit)
+
+async def main():
     """Run all tests."""
     print("🚀 Reddit MCP Server Test Suite")
     print("=" * 50)
     
+    reddit = await check_reddit_credentials()
+    if not reddit:
+        # Every other test needs a working client, so don't spend requests on them
+        print("\n⚠️  Skipping remaining tests: fix your Reddit API credentials in .env first.")
+        sys.exit(1)
+    
     tests = [
-        ("Reddit Credentials", check_reddit_credentials),
-        ("Subreddit Access", test_subreddit_access),
-        ("Search Functionality", test_search_functionality),
-        ("User Access", test_user_access),
-        ("Comment Access", test_comment_access),
-        ("Rate Limiting", test_rate_limiting),
+        ("Subreddit Access", check_subreddit_access),
+        ("Search Functionality", check_search_functionality),
+        ("User Access", check_user_access),
+        ("Comment Access", check_comment_access),
+        ("Rate Limiting", check_rate_limiting),
     ]
     
-    passed = 0
-    total = len(tests)
+    passed = 1
+    total = len(tests) + 1
+    
+    # The remaining tests are independent, so overlap their network waits
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+    buffers = [io.StringIO() for _ in tests]
+    results = await asyncio.gather(
+        *(run_test(semaphore, test_func, reddit, buf) for (_, test_func), buf in zip(tests, buffers)),
+        return_exceptions=True
+    )
+    for (test_name, _), result, buf in zip(tests, results, buffers):
+        sys.stdout.write(buf.getvalue())
+        if isinstance(result, Exception):
+            print(f"❌ {test_name} failed with exception: {result}")
+        elif result:
+            passed += 1
     
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
+    await reddit.close()
     
     print("\n" + "=" * 50)
     print(f"📊 Test Results: {passed}/{total} tests passed")
@@ -234,4 +359,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
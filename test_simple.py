@@ -1,29 +1,15 @@
 #!/usr/bin/env python3
+"""Quick Reddit connection check, sharing the credential test of test_server.py."""
 import asyncio
-import os
-from dotenv import load_dotenv
-import praw
+import sys
 
-print("Starting simple test...")
+from test_server import check_reddit_credentials
 
-# Load environment variables
-load_dotenv()
-print("Environment loaded")
+async def main():
+    reddit = await check_reddit_credentials()
+    if reddit:
+        await reddit.close()
+    return reddit is not None
 
-# Test Reddit connection
-print("Testing Reddit connection...")
-reddit = praw.Reddit(
-    client_id=os.getenv("REDDIT_CLIENT_ID"),
-    client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-    user_agent=os.getenv("REDDIT_USER_AGENT", "RedditMCPServer/1.0.0"),
-    check_for_async=False
-)
-
-try:
-    subreddit = reddit.subreddit("python")
-    post = next(subreddit.hot(limit=1))
-    print(f"Reddit connection successful! Test post: {post.title[:50]}")
-except Exception as e:
-    print(f"Reddit connection failed: {e}")
-
-print("Simple test completed")
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)